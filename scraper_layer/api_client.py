@@ -7,7 +7,6 @@ converting scraped profile data into the format expected by the message generato
 
 import os
 import json
-import base64
 import random
 import asyncio
 import httpx
@@ -16,6 +15,25 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 from loguru import logger
 
+try:
+    # SIMD (AVX2/NEON) base64; same b64encode API as the standard library.
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+_DATA_URL_PREFIX = b"data:image;base64,"
+
+
+def _to_data_url(image_bytes: bytes) -> str:
+    """Build a base64 data URL, decoding to str once instead of formatting a second copy."""
+    return (_DATA_URL_PREFIX + base64.b64encode(image_bytes)).decode("ascii")
+
+
+def _encode_file(image_path: str) -> str:
+    """Read and encode an image file; run in a worker thread so the event loop stays free."""
+    with open(image_path, "rb") as image_file:
+        return _to_data_url(image_file.read())
+
 
 async def encode_image_to_base64(image_path: str) -> Optional[str]:
     """
@@ -28,9 +46,7 @@ async def encode_image_to_base64(image_path: str) -> Optional[str]:
         Base64 encoded string of the image or None if failed
     """
     try:
-        with open(image_path, "rb") as image_file:
-            encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
-            return f"data:image;base64,{encoded_string}"
+        return await asyncio.to_thread(_encode_file, image_path)
     except Exception as e:
         logger.error(f"Error encoding image {image_path}: {str(e)}")
         return None
@@ -59,8 +75,7 @@ async def fetch_and_encode_image(url: str) -> Optional[str]:
                 logger.error(f"URL did not return an image: {content_type}")
                 return None
                 
-            encoded_string = base64.b64encode(response.content).decode("utf-8")
-            return f"data:image;base64,{encoded_string}"
+            return _to_data_url(response.content)
     except Exception as e:
         logger.error(f"Error fetching and encoding image from URL: {str(e)}")
         return None
@@ -120,8 +135,10 @@ async def prepare_api_request(profile_data: Dict[str, Any], user_bio: str) -> Op
             image2_path = random.choice(remaining_images)
             
             # Try to encode images to base64
-            image1_encoded = await encode_image_to_base64(image1_path)
-            image2_encoded = await encode_image_to_base64(image2_path)
+            image1_encoded, image2_encoded = await asyncio.gather(
+                encode_image_to_base64(image1_path),
+                encode_image_to_base64(image2_path)
+            )
         
         # Method 2: If local files don't work, try using the URLs directly
         if not image1_encoded or not image2_encoded:
@@ -139,8 +156,10 @@ async def prepare_api_request(profile_data: Dict[str, Any], user_bio: str) -> Op
                 image2_url = random.choice(other_profile_images) if other_profile_images else image1_url
                 
                 # Fetch and encode images
-                image1_encoded = await fetch_and_encode_image(image1_url)
-                image2_encoded = await fetch_and_encode_image(image2_url)
+                image1_encoded, image2_encoded = await asyncio.gather(
+                    fetch_and_encode_image(image1_url),
+                    fetch_and_encode_image(image2_url)
+                )
                 
             # Method 3: Try with unlabeled image URLs as last resort
             elif profile_data.get("image_urls", []):
@@ -152,8 +171,10 @@ async def prepare_api_request(profile_data: Dict[str, Any], user_bio: str) -> Op
                     image2_url = random.choice(image_urls[1:]) if len(image_urls) > 1 else image_urls[0]
                     
                     # Fetch and encode images
-                    image1_encoded = await fetch_and_encode_image(image1_url)
-                    image2_encoded = await fetch_and_encode_image(image2_url)
+                    image1_encoded, image2_encoded = await asyncio.gather(
+                        fetch_and_encode_image(image1_url),
+                        fetch_and_encode_image(image2_url)
+                    )
         
         # Check if we have successfully encoded images
         if not image1_encoded or not image2_encoded:
@@ -8,19 +8,438 @@ and profile data extraction.
 
 import os
 import asyncio
+import gzip
 import re
-import time
-import json
-import sys
+import shutil
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Awaitable, Dict, List, Any, Optional, Tuple, Union
 
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext, Playwright
+from playwright.async_api import Browser, Page, BrowserContext, CDPSession, ElementHandle, Playwright
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from loguru import logger
 
 from config import config
 
 
+# "Name 25" as rendered in the profile header, and the looser "Name, 25" fallback.
+_NAME_AGE_RE = re.compile(r"([^\d]+)\s*(\d+)")
+_NAME_AGE_ALT_RE = re.compile(r"([^\d,]+)(?:,?\s*)(\d+)")
+
+# The visible image carousel. It is looked up once per extraction and its ElementHandle
+# is passed to the carousel JS below, so those calls never rescan the whole document.
+_CAROUSEL_SELECTOR = 'div[data-keyboard-gamepad="true"][aria-hidden="false"]'
+
+# Shared JS helper: read a slide's background-image URL (with &amp; turned back into &).
+_CAROUSEL_HELPERS_JS = '''
+    const slideUrl = (slide) => {
+        if (!slide) return null;
+        const imgDiv = slide.querySelector('div[style*="background-image"]') ||
+                       slide.querySelector('div[role="img"]') ||
+                       slide.querySelector('div[aria-label*="Profile Photo"]');
+        if (!imgDiv) return null;
+        const style = imgDiv.getAttribute("style") || "";
+        const urlMatch = style.match(/url\\(["']?(.*?)["']?\\)/);
+        return urlMatch ? urlMatch[1].replace(/&amp;/g, '&') : null;
+    };
+'''
+
+# Returns the background-image URL of the carousel slide at the given index.
+_GET_IMG_JS = '''(container, index) => {''' + _CAROUSEL_HELPERS_JS + '''
+    return slideUrl(container.querySelectorAll('.keen-slider__slide')[index]);
+}'''
+
+# Reads viewport size, total image count, the index of the visible slide and every
+# already-hydrated slide URL in one call.
+_CAROUSEL_INFO_JS = '''(container) => {''' + _CAROUSEL_HELPERS_JS + '''
+    const info = { found: false, innerWidth: window.innerWidth, innerHeight: window.innerHeight };
+    const slides = container.querySelectorAll('.keen-slider__slide');
+    if (!slides.length) return info;
+    // The first slide's aria-label carries the total image count ("1 of 6").
+    const ariaLabel = slides[0].getAttribute('aria-label') || "";
+    const match = ariaLabel.match(/(\\d+)\\s*of\\s*(\\d+)/i);
+    info.found = true;
+    info.totalImages = match && match.length >= 3 ? parseInt(match[2]) : 0;
+    // The carousel may not be on the first slide, e.g. when extract_images already ran.
+    info.currentIndex = Math.max(0, Array.prototype.findIndex.call(
+        slides, (slide) => slide.getAttribute('aria-hidden') === 'false'));
+    info.slideUrls = Array.from(slides, slideUrl);
+    return info;
+}'''
+
+
+# Installs one MutationObserver on the carousel that tracks which slide is shown, and
+# window.__slideReady(index, timeout), a promise resolving once that slide is visible.
+_SLIDE_OBSERVER_JS = '''(container) => {
+    const shown = () => Array.prototype.findIndex.call(
+        container.querySelectorAll('.keen-slider__slide'),
+        (slide) => slide.getAttribute('aria-hidden') === 'false'
+    );
+    let waiters = [];
+    if (window.__slideObserver) window.__slideObserver.disconnect();
+    window.__slideObserver = new MutationObserver(() => {
+        const index = shown();
+        waiters = waiters.filter((w) => {
+            if (w.index !== index) return true;
+            w.resolve(true);
+            return false;
+        });
+    });
+    window.__slideObserver.observe(container, {subtree: true, attributes: true, attributeFilter: ['aria-hidden']});
+    window.__slideReady = (index, timeout) => new Promise((resolve) => {
+        if (shown() === index) return resolve(true);
+        const waiter = {index, resolve};
+        waiters.push(waiter);
+        setTimeout(() => { waiters = waiters.filter((w) => w !== waiter); resolve(false); }, timeout);
+    });
+    return true;
+}'''
+
+
+# Walks the profile details container, its sections, headers and key/value siblings
+# and returns {section name: {key: value} | text} in one evaluate.
+_EXTRACT_SECTIONS_JS = '''(sel) => {
+    // Broad selector for the container that holds all profile details.
+    const container = document.querySelector(sel.container);
+    if (!container) return null;
+    // Child blocks that likely represent individual sections.
+    let sections = container.querySelectorAll(sel.section);
+    if (!sections.length) {
+        // Fallback: use only the direct children of the container rather
+        // than every nested div, which runs into the thousands on Tinder.
+        sections = container.querySelectorAll(':scope > div');
+    }
+    const data = {};
+    for (const section of sections) {
+        // Use the header as the section name, else the first line of its text.
+        const header = section.querySelector(sel.header);
+        let name;
+        if (header) {
+            name = header.textContent.trim();
+        } else {
+            const text = section.textContent;
+            name = text ? text.trim().split("\\n")[0] : "Unknown";
+        }
+        // Keys are h3 labels; values are their next sibling element.
+        const keys = section.querySelectorAll(sel.key);
+        let content;
+        if (keys.length) {
+            content = {};
+            for (const key of keys) {
+                const sibling = key.nextElementSibling;
+                if (sibling) content[key.textContent.trim()] = sibling.textContent.trim();
+            }
+        } else {
+            // If no key/value structure is detected, store the entire text.
+            content = section.textContent.trim();
+        }
+        data[name] = content;
+    }
+    return data;
+}'''
+
+_SECTION_SELECTORS = {
+    "container": 'div.Bgc\\(--color--background-sparks-profile\\)',
+    "section": 'div.P\\(24px\\)',
+    "header": 'div.Typs\\(body-2-strong\\), h3.Typs\\(subheading-2\\)',
+    "key": 'h3.Typs\\(subheading-2\\)',
+}
+
+
+# Fallback selectors tried in order when the primary name/age or interests selector finds nothing.
+_NAME_ALT_SELECTORS = [
+    'h1',
+    'h1[class*="display"]',
+    'div[class*="name"]',
+    'div[class*="Name"]'
+]
+_INTEREST_ALT_SELECTORS = [
+    'div[class*="Bdrs(30px)"] span',
+    'div[class*="interest"] span',
+    'div[class*="passions"] span',
+    'div[class*="Interests"] span'
+]
+
+# Reads the name/age text, interests and profile sections (everything but the carousel)
+# in one evaluate. Fallback selectors are only queried when the primary one finds nothing;
+# parsing stays in Python (_parse_name_and_age / _merge_interests).
+_PROFILE_SNAPSHOT_JS = '''(args) => {
+    // Selectors run through document.querySelector(All), so they must be plain CSS. A
+    // Playwright-only selector (":text()", "text=") matches nothing instead of throwing.
+    const all = (sel) => { try { return document.querySelectorAll(sel); } catch (e) { return []; } };
+    const texts = (sel) => Array.from(all(sel), (e) => e.textContent.trim()).filter(Boolean);
+    const extractSections = ''' + _EXTRACT_SECTIONS_JS + ''';
+    const nameAgeElement = all(args.nameAge)[0];
+    const nameAge = nameAgeElement ? nameAgeElement.textContent : null;
+    const interests = texts(args.interests);
+    return {
+        nameAge: nameAge,
+        nameAlternatives: nameAge ? [] : args.nameAlternatives.map(texts),
+        interests: interests,
+        interestAlternatives: interests.length ? [] : args.interestAlternatives.map(texts),
+        sections: extractSections(args.sections),
+    };
+}'''
+
+_EMPTY_SNAPSHOT = {
+    "nameAge": None,
+    "nameAlternatives": [],
+    "interests": [],
+    "interestAlternatives": [],
+    "sections": None,
+}
+
+_PROFILE_SNAPSHOT_ARGS = {
+    "nameAge": config.PROFILE_NAME_AGE_SELECTOR,
+    "nameAlternatives": _NAME_ALT_SELECTORS,
+    "interests": config.INTERESTS_SELECTOR,
+    "interestAlternatives": _INTEREST_ALT_SELECTORS,
+    "sections": _SECTION_SELECTORS,
+}
+
+
+# Browser shared across profiles; see get_or_create_browser.
+_BROWSER: Optional[Browser] = None
+
+# Device descriptor used for mobile emulation, read from the registry on first use.
+_IPHONE_DESCRIPTOR: Optional[Dict[str, Any]] = None
+
+# One CDP session per page (keyed by id(page)), attached on first use and reused for
+# every raw CDP command instead of attaching a new session each time.
+_CDP_SESSIONS: Dict[int, CDPSession] = {}
+
+# Analytics and ad requests that only slow page loads; dropped via Network.setBlockedURLs.
+_BLOCKED_URL_PATTERNS = [
+    "*.mixpanel.com/*",
+    "*.segment.io/*",
+    "*doubleclick*",
+    "*google-analytics*",
+    "*googletagmanager*",
+    "*.tindersparks.com/analytics*",
+]
+
+# Bound on outstanding CDP calls so concurrent extractors sharing one (remote)
+# Chrome do not pile up requests on the same DevTools connection.
+# Created lazily inside the running loop: on Python 3.9 a Semaphore binds to the loop
+# current at construction, which at import time is not the one asyncio.run starts.
+_CDP_SEM: Optional[asyncio.Semaphore] = None
+_CDP_SEM_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _cdp_sem() -> asyncio.Semaphore:
+    """Return the CDP concurrency gate for the running event loop."""
+    global _CDP_SEM, _CDP_SEM_LOOP
+    loop = asyncio.get_running_loop()
+    if _CDP_SEM is None or _CDP_SEM_LOOP is not loop:
+        _CDP_SEM = asyncio.Semaphore((os.cpu_count() or 4) * 2 + 1)
+        _CDP_SEM_LOOP = loop
+    return _CDP_SEM
+
+
+async def _eval(target: Union[Page, ElementHandle], *args, **kwargs) -> Any:
+    """Run page.evaluate (or ElementHandle.evaluate) through the CDP concurrency gate."""
+    async with _cdp_sem():
+        return await target.evaluate(*args, **kwargs)
+
+
+async def _query(page: Page, selector: str) -> Optional[ElementHandle]:
+    """Run page.query_selector through the CDP concurrency gate."""
+    async with _cdp_sem():
+        return await page.query_selector(selector)
+
+
+async def _viewport(page: Page) -> Dict[str, int]:
+    """Return the page's inner width and height, evaluating them only once per page."""
+    if getattr(page, "viewport_cache", None) is None:
+        page.viewport_cache = await _eval(page, "({w: window.innerWidth, h: window.innerHeight})")
+    return page.viewport_cache
+
+
+async def _wait_for_slide(page: Page, index: int, timeout: int = 1500) -> None:
+    """
+    Wait until the carousel slide at index is the visible one, instead of a fixed sleep.
+    Resolves from the MutationObserver installed by _SLIDE_OBSERVER_JS, so no polling is involved.
+    Not gated by _cdp_sem: the call mostly idles inside the page and would hold a slot
+    other workers need for up to timeout ms.
+    """
+    shown = await page.evaluate(
+        "([index, timeout]) => window.__slideReady(index, timeout)", [index, timeout]
+    )
+    if not shown:
+        logger.warning(f"Slide {index+1} did not become visible within {timeout}ms")
+
+
+async def _read_snapshot(page: Page) -> Dict[str, Any]:
+    """
+    Read the profile snapshot, falling back to _EMPTY_SNAPSHOT if the evaluate fails
+    (e.g. the execution context was destroyed), so one failed read never loses the profile.
+    """
+    try:
+        return await _eval(page, _PROFILE_SNAPSHOT_JS, _PROFILE_SNAPSHOT_ARGS)
+    except Exception as e:
+        logger.error(f"Error reading profile snapshot: {str(e)}")
+        return _EMPTY_SNAPSHOT
+
+
+async def _with_timeout(coro: Awaitable[Any], timeout_ms: int, default: Any, label: str) -> Any:
+    """Await coro for at most timeout_ms, logging and returning default if it takes longer."""
+    try:
+        return await asyncio.wait_for(coro, timeout_ms / 1000)
+    except asyncio.TimeoutError:
+        logger.warning(f"{label} timed out after {timeout_ms}ms")
+        return default
+
+
+@lru_cache(maxsize=1)
+def _find_chrome_executable(hint: Optional[str]) -> Optional[str]:
+    """
+    Resolve the Chrome executable once per process.
+
+    Args:
+        hint: Configured executable path (CHROME_EXECUTABLE_PATH)
+
+    Returns:
+        Path to a Chrome/Chromium binary, or None to use Playwright's bundled Chromium
+    """
+    if hint and os.path.exists(hint):
+        return hint
+    found = shutil.which("google-chrome") or shutil.which("chromium") or shutil.which("chromium-browser")
+    if hint:
+        logger.warning(f"Chrome executable not found at {hint}; using {found or 'bundled Chromium'}")
+    return found
+
+
+async def get_or_create_browser(playwright: Playwright) -> Browser:
+    """
+    Return the shared Browser, connecting or launching it only on first use.
+
+    The CDP connection (or launched Chrome) is memoized for the lifetime of the
+    Playwright instance, so scraping several profiles pays the setup cost once.
+
+    Args:
+        playwright: Playwright instance
+
+    Returns:
+        Connected Playwright Browser object
+    """
+    global _BROWSER
+    if _BROWSER is not None and _BROWSER.is_connected():
+        return _BROWSER
+    if config.USE_REMOTE_CHROME:
+        logger.info(f"Attempting to connect to existing Chrome instance on port {config.REMOTE_DEBUGGING_PORT}")
+        _BROWSER = await playwright.chromium.connect_over_cdp(f"http://127.0.0.1:{config.REMOTE_DEBUGGING_PORT}")
+    else:
+        logger.info("Launching a new browser instance")
+        logger.info(f"Using Chrome profile: {config.CHROME_PROFILE_PATH}")
+        _BROWSER = await playwright.chromium.launch(
+            headless=config.HEADLESS,
+            executable_path=_find_chrome_executable(config.CHROME_EXECUTABLE_PATH),
+        )
+    return _BROWSER
+
+
+def _iphone_descriptor(playwright: Playwright) -> Dict[str, Any]:
+    """Return the device descriptor used for mobile emulation, read from the registry once."""
+    global _IPHONE_DESCRIPTOR
+    if _IPHONE_DESCRIPTOR is None:
+        _IPHONE_DESCRIPTOR = playwright.devices['iPhone 12 Pro Max']
+    return _IPHONE_DESCRIPTOR
+
+
+async def new_profile_context(playwright: Playwright, browser: Browser) -> Tuple[BrowserContext, Page]:
+    """
+    Create a fresh mobile-emulated context and page on the shared browser.
+
+    Args:
+        playwright: Playwright instance
+        browser: Playwright browser object
+
+    Returns:
+        Tuple containing the new BrowserContext and Page objects
+    """
+    context = await browser.new_context(**_iphone_descriptor(playwright))
+    page = await context.new_page()
+    return context, page
+
+
+async def get_cdp_session(page: Page) -> CDPSession:
+    """
+    Return the cached CDP session for a page, attaching one on first use.
+
+    Args:
+        page: Playwright page object
+
+    Returns:
+        CDPSession attached to the page
+    """
+    session = _CDP_SESSIONS.get(id(page))
+    if session is None:
+        session = await page.context.new_cdp_session(page)
+        _CDP_SESSIONS[id(page)] = session
+    return session
+
+
+async def release_cdp_session(page: Page) -> None:
+    """
+    Detach and forget the cached CDP session for a page, if any.
+
+    Args:
+        page: Playwright page object
+    """
+    session = _CDP_SESSIONS.pop(id(page), None)
+    if session is not None:
+        try:
+            await session.detach()
+        except Exception as e:
+            logger.debug(f"CDP session already detached: {str(e)}")
+
+
+async def block_tracking_requests(page: Page) -> None:
+    """
+    Block analytics and ad requests for a page through its cached CDP session.
+
+    The block lasts as long as the session stays attached, i.e. until
+    release_cdp_session is called for the page.
+
+    Args:
+        page: Playwright page object
+    """
+    try:
+        session = await get_cdp_session(page)
+        await session.send("Network.enable")
+        await session.send("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.warning(f"Could not block tracking requests: {str(e)}")
+
+
+async def emulate_mobile(playwright: Playwright, page: Page) -> None:
+    """
+    Apply the iPhone emulation to a page of a context the scraper did not create.
+
+    Pages opened in the remote Chrome context get no device emulation from Playwright,
+    so the viewport, touch support and user agent are overridden through the page's
+    cached CDP session. The overrides last until release_cdp_session is called for the page.
+
+    Args:
+        playwright: Playwright instance
+        page: Playwright page object
+    """
+    descriptor = _iphone_descriptor(playwright)
+    try:
+        session = await get_cdp_session(page)
+        await session.send("Emulation.setDeviceMetricsOverride", {
+            "width": descriptor["viewport"]["width"],
+            "height": descriptor["viewport"]["height"],
+            "deviceScaleFactor": descriptor["device_scale_factor"],
+            "mobile": descriptor["is_mobile"],
+        })
+        await session.send("Emulation.setTouchEmulationEnabled", {"enabled": descriptor["has_touch"]})
+        await session.send("Network.setUserAgentOverride", {"userAgent": descriptor["user_agent"]})
+    except Exception as e:
+        logger.warning(f"Could not apply mobile emulation: {str(e)}")
+
+
 async def initialize_browser(playwright: Playwright) -> Tuple[Browser, BrowserContext, Page]:
     """
     Initialize browser with Playwright for Tinder scraping.
@@ -34,9 +453,8 @@ async def initialize_browser(playwright: Playwright) -> Tuple[Browser, BrowserCo
     """
     try:
         if config.USE_REMOTE_CHROME:
-            logger.info(f"Attempting to connect to existing Chrome instance on port {config.REMOTE_DEBUGGING_PORT}")
             try:
-                browser = await playwright.chromium.connect_over_cdp(f"http://localhost:{config.REMOTE_DEBUGGING_PORT}")
+                browser = await get_or_create_browser(playwright)
                 contexts = browser.contexts
                 if not contexts:
                     logger.warning("No contexts found in the connected browser. Creating a new one.")
@@ -51,6 +469,7 @@ async def initialize_browser(playwright: Playwright) -> Tuple[Browser, BrowserCo
                 else:
                     page = pages[0]
                     logger.info("Connected to existing page")
+                await block_tracking_requests(page)
                 logger.info("Successfully connected to Chrome with remote debugging")
                 return browser, context, page
             except Exception as e:
@@ -58,15 +477,9 @@ async def initialize_browser(playwright: Playwright) -> Tuple[Browser, BrowserCo
                 logger.info("Please run './launch_chrome.sh' first to start Chrome with remote debugging")
                 logger.info("Falling back to launching a new browser instance")
                 raise
-        logger.info("Launching a new browser instance")
-        logger.info(f"Using Chrome profile: {config.CHROME_PROFILE_PATH}")
-        browser = await playwright.chromium.launch(
-            headless=config.HEADLESS,
-            executable_path=config.CHROME_EXECUTABLE_PATH,
-        )
-        iphone = playwright.devices['iPhone 12 Pro Max']
-        context = await browser.new_context(**iphone)
-        page = await context.new_page()
+        browser = await get_or_create_browser(playwright)
+        context, page = await new_profile_context(playwright, browser)
+        await block_tracking_requests(page)
         logger.info("Successfully launched a new browser with mobile emulation")
         return browser, context, page
     except Exception as e:
@@ -99,19 +512,31 @@ async def navigate_to_tinder(page: Page) -> bool:
     """
     try:
         current_url = page.url
-        if "tinder.com" in current_url:
+        if "tinder.com" in current_url and "/login" not in current_url:
+            # The page is already interactive; the extractors wait on their own selectors.
             logger.info(f"Already on Tinder: {current_url}")
-            await page.wait_for_load_state("networkidle")
+            return True
+        target_url = config.TARGET_URL
+        if "?" in target_url:
+            target_url += "&go-mobile=1"
         else:
-            target_url = config.TARGET_URL
-            if "?" in target_url:
-                target_url += "&go-mobile=1"
-            else:
-                target_url += "?go-mobile=1"
-            logger.info(f"Navigating to {target_url}")
-            await page.goto(target_url, timeout=config.PAGE_LOAD_TIMEOUT)
-            await page.wait_for_load_state("networkidle")
-        if await page.is_visible('text="Log in"'):
+            target_url += "?go-mobile=1"
+        logger.info(f"Navigating to {target_url}")
+        await page.goto(target_url, timeout=config.PAGE_LOAD_TIMEOUT, wait_until="domcontentloaded")
+        try:
+            # Wait only for the first element we need (or the login prompt), not for network idle.
+            await page.wait_for_selector(
+                f"{config.PROFILE_NAME_AGE_SELECTOR}, {config.LOGIN_SELECTOR}",
+                timeout=config.ELEMENT_TIMEOUT
+            )
+        except PlaywrightTimeoutError:
+            logger.warning("Profile content did not appear before the element timeout")
+        # A login URL is detected with no CDP call at all; otherwise a structural probe
+        # short-circuits on the first match instead of walking every text node.
+        login_required = "/login" in page.url
+        if not login_required:
+            login_required = await page.locator(config.LOGIN_SELECTOR).first.is_visible()
+        if login_required:
             logger.warning("Login required - please use a Chrome profile that's already logged in to Tinder")
             return False
         logger.info("Successfully connected to Tinder")
@@ -126,8 +551,9 @@ async def interact_with_profile(page: Page) -> bool:
     Interact with a Tinder profile to expand details.
 
     Instead of searching slide-by-slide for the "Show more" button, this version
-    clicks at the bottom-center of the screen (about 20% up from the bottom) which
-    performs the same function. After that, it robustly checks for a "View all" button
+    looks it up across all slides with a single query and clicks it; if it is missing
+    or not clickable, it clicks at the bottom-center of the screen (about 20% up from
+    the bottom) which performs the same function. After that, it robustly checks for a "View all" button
     (by looking for a div with role="button" that contains the text "View all") and clicks
     it if available.
 
@@ -138,27 +564,49 @@ async def interact_with_profile(page: Page) -> bool:
         bool: True if interaction (or fallback) was successful, False otherwise.
     """
     try:
-        await asyncio.sleep(1)
-
-        # Get screen dimensions.
-        screen_width = await page.evaluate("window.innerWidth")
-        screen_height = await page.evaluate("window.innerHeight")
-        # Calculate coordinates: horizontally centered and 20% up from the bottom.
-        x = int(screen_width / 2)
-        y = int(screen_height * 0.8)
-
-        # Click on the bottom-center of the screen to pull up the profile details.
-        logger.info("Clicking on bottom-center of screen to open profile details...")
-        await page.mouse.click(x, y)
-        await asyncio.sleep(1.0)
+        # All slides are in the DOM at once (just aria-hidden), so a single query finds the
+        # "Show more" button wherever it is, without tapping through the slides.
+        show_more_clicked = False
+        show_more_button = await _query(page, config.SHOW_MORE_SELECTOR)
+        if show_more_button:
+            try:
+                await show_more_button.scroll_into_view_if_needed(timeout=config.WAIT_BETWEEN_ACTIONS)
+                await show_more_button.click(timeout=config.WAIT_BETWEEN_ACTIONS)
+                show_more_clicked = True
+                logger.info("Clicked 'Show more' button.")
+            except PlaywrightError as e:
+                # Timeouts, detached or covered elements: fall back to the blind tap below.
+                logger.info(f"'Show more' button is not clickable on the current slide: {str(e)}")
+
+        if not show_more_clicked:
+            # Get screen dimensions.
+            viewport = await _viewport(page)
+            screen_width, screen_height = viewport["w"], viewport["h"]
+            # Calculate coordinates: horizontally centered and 20% up from the bottom.
+            x = int(screen_width / 2)
+            y = int(screen_height * 0.8)
+
+            # Click on the bottom-center of the screen to pull up the profile details.
+            logger.info("Clicking on bottom-center of screen to open profile details...")
+            await page.mouse.click(x, y)
+        # Proceed as soon as the details container is rendered, but never wait longer than
+        # the fixed 1s delay this replaced, since the class selector may not match at all.
+        try:
+            await page.wait_for_selector(_SECTION_SELECTORS["container"], timeout=1000)
+        except PlaywrightTimeoutError:
+            logger.warning("Profile details container did not appear after opening details")
 
         # Robustly check for the "View all" button.
         logger.info("Looking for 'View all' button on details page...")
-        view_all_button = await page.query_selector('div[role="button"]:has-text("View all")')
+        view_all_button = await _query(page, 'div[role="button"]:has-text("View all")')
         if view_all_button:
             await view_all_button.click()
             logger.info("Clicked 'View all' button.")
-            await asyncio.sleep(config.WAIT_BETWEEN_ACTIONS / 1000)
+            # The button goes away once the full list has expanded; never wait longer than before.
+            try:
+                await view_all_button.wait_for_element_state("hidden", timeout=config.WAIT_BETWEEN_ACTIONS)
+            except PlaywrightTimeoutError:
+                pass
         else:
             logger.info("No 'View all' button found; proceeding.")
 
@@ -168,49 +616,32 @@ async def interact_with_profile(page: Page) -> bool:
         return False
 
 
-async def extract_name_and_age(page: Page) -> Tuple[Optional[str], Optional[int]]:
+def _parse_name_and_age(name_age_text: Optional[str],
+                        alternative_texts: List[List[str]]) -> Tuple[Optional[str], Optional[int]]:
     """
-    Extract name and age from Tinder profile.
+    Parse name and age from the profile header text, falling back to alternative selector texts.
 
     Args:
-        page: Playwright page object
+        name_age_text: Text of the PROFILE_NAME_AGE_SELECTOR element, if any
+        alternative_texts: Texts matched by each of _NAME_ALT_SELECTORS, in order
 
     Returns:
         Tuple containing name (str) and age (int)
     """
-    try:
-        name_age_element = await page.query_selector(config.PROFILE_NAME_AGE_SELECTOR)
-        if name_age_element:
-            name_age_text = await name_age_element.text_content()
-            if name_age_text:
-                match = re.search(r"([^\d]+)\s*(\d+)", name_age_text)
-                if match:
-                    name = match.group(1).strip()
-                    age = int(match.group(2))
-                    return name, age
-                else:
-                    return name_age_text.strip(), None
-        alt_selectors = [
-            'h1',
-            'h1[class*="display"]',
-            'div[class*="name"]',
-            'div[class*="Name"]'
-        ]
-        for selector in alt_selectors:
-            elements = await page.query_selector_all(selector)
-            for element in elements:
-                text = await element.text_content()
-                if text:
-                    match = re.search(r"([^\d,]+)(?:,?\s*)(\d+)", text)
-                    if match:
-                        name = match.group(1).strip()
-                        age = int(match.group(2))
-                        logger.info(f"Found name and age using alternative selector: {name}, {age}")
-                        return name, age
-        return None, None
-    except Exception as e:
-        logger.error(f"Error extracting name and age: {str(e)}")
-        return None, None
+    if name_age_text:
+        match = _NAME_AGE_RE.search(name_age_text)
+        if match:
+            return match.group(1).strip(), int(match.group(2))
+        return name_age_text.strip(), None
+    for texts in alternative_texts:
+        for text in texts:
+            match = _NAME_AGE_ALT_RE.search(text)
+            if match:
+                name = match.group(1).strip()
+                age = int(match.group(2))
+                logger.info(f"Found name and age using alternative selector: {name}, {age}")
+                return name, age
+    return None, None
 
 
 async def extract_images(page: Page) -> List[str]:
@@ -218,11 +649,13 @@ async def extract_images(page: Page) -> List[str]:
     Extract image URLs from Tinder carousel using DOM navigation and simulated taps.
 
     Steps:
-      1. Locate the carousel container and read the total number of images from the first slide's aria-label.
-      2. Extract the first image URL from slide index 0.
-      3. For each subsequent image, simulate a tap on the right side of the screen to load the next image,
-         wait for the slide transition, then extract its URL by slide index.
-      4. After collecting all image URLs, simulate left taps to return to the 3rd image (or remain if fewer than 3).
+      1. In a single evaluate, locate the carousel container, read the total number of images from the
+         first slide's aria-label, the viewport size, the visible slide and the URL of every slide
+         already in the DOM.
+      2. Take the first image URL from slide index 0.
+      3. For each subsequent image, use the batched URL; only when a slide has not been hydrated yet,
+         tap the right side of the screen until it is shown, then extract its URL by slide index.
+      4. Finally, tap right or left to leave the carousel on the 3rd image (or the last if fewer than 3).
 
     Returns:
       List of image URLs.
@@ -233,28 +666,12 @@ async def extract_images(page: Page) -> List[str]:
         if not hasattr(page, "profile_data"):
             page.profile_data = {}
 
-        labeled_urls = {}
-        clean_urls = []
+        raw_urls = {}
 
-        # Step 1: Find the carousel container and total image count.
-        carousel_info = await page.evaluate('''() => {
-            // Select the carousel container with data-keyboard-gamepad="true" and aria-hidden="false"
-            const container = document.querySelector('div[data-keyboard-gamepad="true"][aria-hidden="false"]');
-            if (container) {
-                // Extract the first slide to get the total image count from its aria-label
-                const firstSlide = container.querySelector('.keen-slider__slide');
-                if (firstSlide) {
-                    const ariaLabel = firstSlide.getAttribute('aria-label') || "";
-                    const match = ariaLabel.match(/(\\d+)\\s*of\\s*(\\d+)/i);
-                    let totalImages = 0;
-                    if (match && match.length >= 3) {
-                        totalImages = parseInt(match[2]);
-                    }
-                    return { found: true, totalImages: totalImages };
-                }
-            }
-            return { found: false };
-        }''')
+        # Step 1: Find the carousel once, then read the viewport size and hydrated slide URLs
+        # in one round-trip.
+        container = await _query(page, _CAROUSEL_SELECTOR)
+        carousel_info = await _eval(container, _CAROUSEL_INFO_JS) if container else None
 
         if not carousel_info or not carousel_info.get("found"):
             logger.error("Failed to locate image carousel container")
@@ -265,68 +682,68 @@ async def extract_images(page: Page) -> List[str]:
         if total_images < 1:
             logger.error("No images found in carousel")
             return []
+        slide_urls = carousel_info.get("slideUrls") or []
+        await _eval(container, _SLIDE_OBSERVER_JS)
 
         # Helper function: get the image URL from a slide by index.
         async def get_image_by_index(index):
-            return await page.evaluate('(index) => { '
-                'const container = document.querySelector(\'div[data-keyboard-gamepad="true"][aria-hidden="false"]\');'
-                'if (!container) return null;'
-                'const slides = container.querySelectorAll(\'.keen-slider__slide\');'
-                'if (index < slides.length) {'
-                '  const slide = slides[index];'
-                '  let imgDiv = slide.querySelector(\'div[style*="background-image"]\') || '
-                '               slide.querySelector(\'div[role="img"]\') || '
-                '               slide.querySelector(\'div[aria-label*="Profile Photo"]\');'
-                '  if (!imgDiv) return null;'
-                '  const style = imgDiv.getAttribute("style") || "";'
-                '  const urlMatch = style.match(/url\\(["\\\']?(.*?)["\\\']?\\)/);'
-                '  return urlMatch ? urlMatch[1] : null;'
-                '}'
-                'return null;'
-                '}', index)
+            return await _eval(container, _GET_IMG_JS, index)
 
         # Step 2: Extract the first image (slide index 0).
-        first_url = await get_image_by_index(0)
+        first_url = slide_urls[0] if slide_urls else await get_image_by_index(0)
         if not first_url:
             logger.error("Failed to extract the first image URL")
             return []
-        first_url = first_url.replace('&amp;', '&')
-        labeled_urls["Profile Photo 1"] = first_url
-        clean_urls.append(first_url)
-        logger.info(f"Extracted Profile Photo 1: {first_url[:60]}...")
-
-        # Calculate tap positions.
-        screen_width = await page.evaluate("window.innerWidth")
-        screen_height = await page.evaluate("window.innerHeight")
-        right_tap_x = int(screen_width * 0.8)   # tap on right 80% of screen width
-        left_tap_x = int(screen_width * 0.2)    # tap on left 20% of screen width
-        tap_y = int(screen_height * 0.5)        # vertically centered
-
-        # Step 3: For each subsequent image, tap right and extract its URL by slide index.
+        raw_urls[0] = first_url
+
+        # Keep the viewport size for interact_with_profile's tap coordinates.
+        page.viewport_cache = {"w": carousel_info["innerWidth"], "h": carousel_info["innerHeight"]}
+
+        # Calculate tap positions. Arrow keys are not an option here: on Tinder the
+        # data-keyboard-gamepad layer maps ArrowRight/ArrowLeft to Like/Nope.
+        right_tap_x = int(carousel_info["innerWidth"] * 0.8)   # tap on right 80% of screen width
+        left_tap_x = int(carousel_info["innerWidth"] * 0.2)    # tap on left 20% of screen width
+        tap_y = int(carousel_info["innerHeight"] * 0.5)        # vertically centered
+
+        # Step 3: Use the batched URLs; only tap forward to hydrate lazy-loaded slides.
+        current_index = carousel_info.get("currentIndex", 0)
         for i in range(1, total_images):
-            logger.info(f"Tapping to load image {i+1} of {total_images}...")
-            await page.mouse.click(right_tap_x, tap_y)
-            await asyncio.sleep(1.0)  # increased delay to ensure slide transition
-            img_url = await get_image_by_index(i)
+            img_url = slide_urls[i] if i < len(slide_urls) else None
+            if not img_url:
+                while current_index < i:
+                    logger.info(f"Tapping to load image {current_index+2} of {total_images}...")
+                    await page.mouse.click(right_tap_x, tap_y)
+                    current_index += 1
+                    await _wait_for_slide(page, current_index)
+                img_url = await get_image_by_index(i)
             if not img_url:
                 logger.warning(f"Could not extract image URL for image {i+1}")
                 continue
-            img_url = img_url.replace('&amp;', '&')
-            label = f"Profile Photo {i+1}"
+            raw_urls[i] = img_url
+
+        # Step 4: Leave the carousel on the third image (if there are at least 3).
+        target_index = min(3, total_images) - 1
+        moves_needed = target_index - current_index
+        tap_x = right_tap_x if moves_needed > 0 else left_tap_x
+        step = 1 if moves_needed > 0 else -1
+        logger.info(f"Navigating to image {target_index+1} with {abs(moves_needed)} taps...")
+        for _ in range(abs(moves_needed)):
+            await page.mouse.click(tap_x, tap_y)
+            current_index += step
+            await _wait_for_slide(page, current_index)
+
+        # Label and deduplicate the collected URLs in a single pass.
+        labeled_urls = {}
+        clean_urls = []
+        seen_urls = set()
+        for index, img_url in raw_urls.items():
+            label = f"Profile Photo {index+1}"
             labeled_urls[label] = img_url
-            if img_url not in clean_urls:
+            if img_url not in seen_urls:
+                seen_urls.add(img_url)
                 clean_urls.append(img_url)
             logger.info(f"Extracted {label}: {img_url[:60]}...")
 
-        # Step 4: Navigate back to the third image (if there are at least 3).
-        target_image = 3 if total_images >= 3 else total_images
-        current_image = total_images  # assume the last loaded slide is current
-        left_taps_needed = current_image - target_image
-        logger.info(f"Navigating back to image {target_image} by tapping left {left_taps_needed} times...")
-        for _ in range(left_taps_needed):
-            await page.mouse.click(left_tap_x, tap_y)
-            await asyncio.sleep(1.0)
-
         logger.info(f"Completed image extraction. Found {len(clean_urls)} images.")
         page.profile_data["image_urls"] = clean_urls
         page.profile_data["labeled_image_urls"] = labeled_urls
@@ -338,104 +755,64 @@ async def extract_images(page: Page) -> List[str]:
 
 
 
-async def extract_interests(page: Page) -> List[str]:
+def _merge_interests(interests: List[str], alternative_texts: List[List[str]]) -> List[str]:
     """
-    Extract interests from Tinder profile.
+    Use the primary interest texts, or the deduplicated alternative selector texts if there are none.
 
     Args:
-        page: Playwright page object
+        interests: Texts matched by INTERESTS_SELECTOR
+        alternative_texts: Texts matched by each of _INTEREST_ALT_SELECTORS, in order
 
     Returns:
         List of interests
     """
-    interests = []
-    try:
-        interest_elements = await page.query_selector_all(config.INTERESTS_SELECTOR)
-        for element in interest_elements:
-            interest_text = await element.text_content()
-            if interest_text:
-                interests.append(interest_text.strip())
-        if not interests:
-            alt_selectors = [
-                'div[class*="Bdrs(30px)"] span',
-                'div[class*="interest"] span',
-                'div[class*="passions"] span',
-                'div[class*="Interests"] span'
-            ]
-            for selector in alt_selectors:
-                elements = await page.query_selector_all(selector)
-                for element in elements:
-                    text = await element.text_content()
-                    if text and text.strip() not in interests:
-                        interests.append(text.strip())
-        logger.info(f"Extracted {len(interests)} interests")
-        return interests
-    except Exception as e:
-        logger.error(f"Error extracting interests: {str(e)}")
-        return interests
+    if interests:
+        return list(interests)
+    merged = []
+    seen = set()
+    for texts in alternative_texts:
+        for text in texts:
+            if text not in seen:
+                seen.add(text)
+                merged.append(text)
+    return merged
+
+
+async def capture_html(page: Page) -> bytes:
+    """
+    Capture the page HTML gzip-compressed (consumers must gzip.decompress).
+    Level 1 is fast and shrinks the multi-hundred-KB document several times over.
 
+    Args:
+        page: Playwright page object
 
-async def extract_profile_sections(page: Page) -> Dict[str, Any]:
+    Returns:
+        Gzip-compressed UTF-8 HTML of the page
     """
-    Extract all profile details from Tinder’s profile details container.
-    This function attempts to capture all information regardless of how the user has chosen to display it.
-    It does so by selecting the main details container (using a broad CSS selector based on observed HTML)
-    and then iterating over its child sections. For each section, it will try to detect a header (section name)
-    and then extract key/value pairs (if present) or fallback to saving the full text.
+    raw_html = await page.content()
+    return gzip.compress(raw_html.encode("utf-8"), compresslevel=1)
 
-    Returns:
-        Dictionary containing profile section information.
+
+async def discard_html_future(profile_data: Dict[str, Any]) -> None:
     """
-    sections_data = {}
-    try:
-        # Broad selector for the container that holds all profile details.
-        container = await page.query_selector('div.Bgc\\(--color--background-sparks-profile\\)')
-        if not container:
-            logger.warning("Profile details container not found.")
-            return sections_data
-
-        # Get child blocks that likely represent individual sections.
-        # (Using a class pattern observed in the sample HTML; adjust as needed.)
-        section_elements = await container.query_selector_all('div.P\\(24px\\)')
-        if not section_elements:
-            # Fallback: use all direct children of the container.
-            section_elements = await container.query_selector_all('div')
-
-        for section in section_elements:
-            # Attempt to extract a section name from a header.
-            header = await section.query_selector('div.Typs\\(body-2-strong\\), h3.Typs\\(subheading-2\\)')
-            if header:
-                section_name = (await header.text_content()).strip()
-            else:
-                # If no header is found, use the first line of the section's text as its name.
-                text = await section.text_content()
-                section_name = text.strip().split("\n")[0] if text else "Unknown"
-
-            # Now, try to extract key/value pairs.
-            # Look for keys as any h3 element with a class that suggests a label.
-            kv_elements = await section.query_selector_all('h3.Typs\\(subheading-2\\)')
-            content = {}
-            if kv_elements:
-                for kv in kv_elements:
-                    key = (await kv.text_content()).strip()
-                    # Try to get the next sibling element that might contain the value.
-                    sibling = await kv.evaluate_handle("node => node.nextElementSibling")
-                    if sibling:
-                        value = (await sibling.text_content()).strip()
-                        content[key] = value
-            else:
-                # If no key/value structure is detected, store the entire text.
-                full_text = await section.text_content()
-                content = full_text.strip()
-            sections_data[section_name] = content
+    Drop the HTML capture of a profile that will not be saved.
 
-        # Log the extracted sections for debugging.
-        logger.info(f"Extracted {len(sections_data)} profile sections: {list(sections_data.keys())}")
-        return sections_data
+    The task is cancelled if still running, otherwise its exception is retrieved
+    and logged, so a failed capture never surfaces as "exception was never retrieved".
 
+    Args:
+        profile_data: Profile dictionary from extract_profile_data
+    """
+    html_future = profile_data.pop("html_future", None)
+    if html_future is None:
+        return
+    html_future.cancel()
+    try:
+        await html_future
+    except asyncio.CancelledError:
+        pass
     except Exception as e:
-        logger.error(f"Error extracting profile sections: {str(e)}")
-        return sections_data
+        logger.error(f"Error capturing profile HTML: {str(e)}")
 
 
 async def extract_profile_data(page: Page) -> Dict[str, Any]:
@@ -450,22 +827,35 @@ async def extract_profile_data(page: Page) -> Dict[str, Any]:
     """
     profile_data = {}
     try:
-        name, age = await extract_name_and_age(page)
+        # Everything except the carousel is read by one evaluate, which overlaps with the
+        # carousel walk in extract_images.
+        # Each stage is bounded so one stuck CDP call cannot hold up the whole profile.
+        image_urls, snapshot = await asyncio.gather(
+            _with_timeout(extract_images(page), config.PAGE_LOAD_TIMEOUT, [], "Image extraction"),
+            _with_timeout(_read_snapshot(page), config.ELEMENT_TIMEOUT, _EMPTY_SNAPSHOT, "Profile snapshot")
+        )
+        name, age = _parse_name_and_age(snapshot["nameAge"], snapshot["nameAlternatives"])
+        section_data = snapshot["sections"]
+        if section_data is None:
+            logger.warning("Profile details container not found.")
+            section_data = {}
+        else:
+            logger.info(f"Extracted {len(section_data)} profile sections: {list(section_data.keys())}")
+        interests = _merge_interests(snapshot["interests"], snapshot["interestAlternatives"])
+        logger.info(f"Extracted {len(interests)} interests")
         profile_data["name"] = name
         if age:
             profile_data["age"] = age
-        image_urls = await extract_images(page)
         profile_data["image_urls"] = image_urls
-        section_data = await extract_profile_sections(page)
         profile_data["profile_sections"] = section_data
         if "Interests" in section_data and isinstance(section_data["Interests"], list):
             profile_data["interests"] = section_data["Interests"]
-        else:
-            interests = await extract_interests(page)
-            if interests:
-                profile_data["interests"] = interests
+        elif interests:
+            profile_data["interests"] = interests
         if config.SAVE_HTML:
-            profile_data["html"] = await page.content()
+            # Serialized in the background so downstream processing can start right away;
+            # consumers await html_future only when they write the HTML out.
+            profile_data["html_future"] = asyncio.create_task(capture_html(page))
         if hasattr(page, "profile_data"):
             for key, value in page.profile_data.items():
                 profile_data[key] = value
@@ -476,6 +866,112 @@ async def extract_profile_data(page: Page) -> Dict[str, Any]:
         return profile_data
 
 
+async def scrape_profile(page: Page, profile_url: str) -> Dict[str, Any]:
+    """
+    Open a single Tinder profile URL and extract its data.
+
+    Args:
+        page: Playwright page object dedicated to this scrape
+        profile_url: URL of the profile to scrape
+
+    Returns:
+        Dictionary containing profile information (empty if extraction failed)
+    """
+    try:
+        page.profile_data = {}
+        logger.info(f"Opening profile {profile_url}")
+        await page.goto(profile_url, timeout=config.PAGE_LOAD_TIMEOUT)
+        await page.wait_for_load_state("domcontentloaded")
+        if not await extract_images(page):
+            logger.error(f"Failed to extract any images from {profile_url}")
+            return {}
+        if not await interact_with_profile(page):
+            logger.error(f"Failed to interact with profile {profile_url}")
+            return {}
+        return await extract_profile_data(page)
+    except Exception as e:
+        logger.error(f"Error scraping profile {profile_url}: {str(e)}")
+        return {}
+
+
+async def scrape_many(playwright: Playwright, browser: Browser, profile_urls: List[str],
+                      n_workers: int = 4,
+                      profile_queue: Optional[asyncio.Queue] = None) -> List[Dict[str, Any]]:
+    """
+    Scrape several Tinder profiles concurrently.
+
+    All workers are pages in one BrowserContext, so they share its cookies, cache
+    and connection pool. With remote Chrome that is the user's logged-in context,
+    and each worker page is emulated over CDP (see emulate_mobile); otherwise a single
+    mobile-emulated context is created for the batch. Profiles are handed out to
+    whichever page is idle. CDP calls are I/O bound, so the per-profile tap and wait
+    budgets overlap across workers.
+
+    Args:
+        playwright: Playwright instance
+        browser: Playwright browser object
+        profile_urls: URLs of the profiles to scrape
+        n_workers: Maximum number of profiles scraped at the same time
+        profile_queue: Optional queue that receives (profile_url, profile_data) as soon as
+            each profile is scraped, so downloads can start while other workers are busy
+
+    Returns:
+        List of profile data dictionaries, in the same order as profile_urls
+    """
+    if not profile_urls:
+        return []
+    worker_count = max(1, min(n_workers, len(profile_urls)))
+    logger.info(f"Scraping {len(profile_urls)} profiles with {worker_count} workers")
+    context = None
+    owns_context = not (config.USE_REMOTE_CHROME and browser.contexts)
+    pages = []
+    idle_pages: asyncio.Queue = asyncio.Queue()
+    try:
+        if owns_context:
+            context, page = await new_profile_context(playwright, browser)
+            pages.append(page)
+        else:
+            context = browser.contexts[0]
+        while len(pages) < worker_count:
+            page = await context.new_page()
+            pages.append(page)
+            if not owns_context:
+                await emulate_mobile(playwright, page)
+        for page in pages:
+            await block_tracking_requests(page)
+            idle_pages.put_nowait(page)
+
+        async def run(profile_url: str) -> Dict[str, Any]:
+            page = await idle_pages.get()
+            try:
+                profile_data = await scrape_profile(page, profile_url)
+                # The HTML must be captured before the page moves on to the next profile.
+                html_future = profile_data.get("html_future")
+                if html_future:
+                    await asyncio.wait([html_future])
+                    if not html_future.cancelled() and html_future.exception():
+                        logger.error(f"Error capturing HTML for {profile_url}: {str(html_future.exception())}")
+                        del profile_data["html_future"]
+                if profile_queue is not None:
+                    await profile_queue.put((profile_url, profile_data))
+                return profile_data
+            finally:
+                idle_pages.put_nowait(page)
+
+        return list(await asyncio.gather(*(run(url) for url in profile_urls)))
+    finally:
+        for page in pages:
+            await release_cdp_session(page)
+        try:
+            if owns_context and context is not None:
+                await context.close()
+            else:
+                for page in pages:
+                    await page.close()
+        except Exception as e:
+            logger.error(f"Error closing worker pages: {str(e)}")
+
+
 async def close_browser(browser: Browser, context: BrowserContext, page: Page) -> None:
     """
     Properly close all browser resources.
@@ -485,7 +981,9 @@ async def close_browser(browser: Browser, context: BrowserContext, page: Page) -
         context: Playwright browser context
         page: Playwright page object
     """
+    global _BROWSER
     try:
+        await release_cdp_session(page)
         if config.USE_REMOTE_CHROME:
             logger.info("Not closing browser since we're using remote debugging")
         else:
@@ -493,6 +991,8 @@ async def close_browser(browser: Browser, context: BrowserContext, page: Page) -
             await page.close()
             await context.close()
             await browser.close()
+            if browser is _BROWSER:
+                _BROWSER = None
             logger.info("Browser resources closed")
     except Exception as e:
         logger.error(f"Error closing browser: {str(e)}")
@@ -6,15 +6,15 @@ from environment variables with smart defaults.
 """
 
 import os
-from pydantic import field_validator
-from pydantic_settings import BaseSettings
+from dataclasses import dataclass
 from typing import Optional
 from dotenv import load_dotenv
 import pathlib
 
 load_dotenv()
 
-class TinderConfig(BaseSettings):
+@dataclass
+class TinderConfig:
     """Configuration settings for the Tinder profile scraper."""
 
     TARGET_URL: str = os.getenv("TARGET_URL", "https://tinder.com/app/recs")
@@ -30,31 +30,22 @@ class TinderConfig(BaseSettings):
     NAVIGATION_TIMEOUT: int = int(os.getenv("NAVIGATION_TIMEOUT", "30000"))
     ELEMENT_TIMEOUT: int = int(os.getenv("ELEMENT_TIMEOUT", "10000"))
     SESSION_STORAGE_DIR: str = os.getenv("SESSION_STORAGE_DIR", "./browser_sessions")
-    CAROUSEL_ITEM_SELECTOR: str = 'id=carousel-item-{}'
-    PROFILE_NAME_AGE_SELECTOR: str = 'h1[class*="Typs(display-2-strong)"]'
-    SHOW_MORE_SELECTOR: str = 'div[class*="Bdrs(30px)"] span:text("Show more")'
-    VIEW_ALL_SELECTOR: str = 'div[class*="Px(16px)"]:text("View all 5")'
-    INTERESTS_SELECTOR: str = 'div[class*="Gp(8px)"] div[class*="Bdrs(30px)"] span'
-    PROFILE_SECTION_SELECTOR: str = 'div[class*="Mt(8px)"] div[class*="P(24px)"]'
+    CAROUSEL_ITEM_SELECTOR: str = os.getenv("CAROUSEL_ITEM_SELECTOR", 'id=carousel-item-{}')
+    # PROFILE_NAME_AGE_SELECTOR and INTERESTS_SELECTOR are read by document.querySelector in
+    # the profile snapshot, so overrides must be plain CSS (no Playwright ":text()" or "text=").
+    PROFILE_NAME_AGE_SELECTOR: str = os.getenv("PROFILE_NAME_AGE_SELECTOR", 'h1[class*="Typs(display-2-strong)"]')
+    SHOW_MORE_SELECTOR: str = os.getenv("SHOW_MORE_SELECTOR", 'div[class*="Bdrs(30px)"] span:text("Show more")')
+    VIEW_ALL_SELECTOR: str = os.getenv("VIEW_ALL_SELECTOR", 'div[class*="Px(16px)"]:text("View all 5")')
+    INTERESTS_SELECTOR: str = os.getenv("INTERESTS_SELECTOR", 'div[class*="Gp(8px)"] div[class*="Bdrs(30px)"] span')
+    PROFILE_SECTION_SELECTOR: str = os.getenv("PROFILE_SECTION_SELECTOR", 'div[class*="Mt(8px)"] div[class*="P(24px)"]')
+    LOGIN_SELECTOR: str = os.getenv("LOGIN_SELECTOR", 'a[href*="/login"], button[data-testid*="login"]')
     WAIT_BETWEEN_ACTIONS: int = int(os.getenv("WAIT_BETWEEN_ACTIONS", "500"))
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE: Optional[str] = os.getenv("LOG_FILE", "scraper.log")
     SAVE_HTML: bool = os.getenv("SAVE_HTML", "True").lower() == "true"
 
-    @field_validator("OUTPUT_DIR")
-    def create_output_dir(cls, v):
-        path = pathlib.Path(v)
-        path.mkdir(parents=True, exist_ok=True)
-        return v
-
-    @field_validator("SESSION_STORAGE_DIR")
-    def create_session_dir(cls, v):
-        path = pathlib.Path(v)
-        path.mkdir(parents=True, exist_ok=True)
-        return v
-
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    def __post_init__(self):
+        pathlib.Path(self.OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
+        pathlib.Path(self.SESSION_STORAGE_DIR).mkdir(parents=True, exist_ok=True)
 
 config = TinderConfig()
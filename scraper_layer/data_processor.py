@@ -9,17 +9,128 @@ import os
 import sys
 import json
 import asyncio
+import itertools
+import random
+import aiofiles
 import httpx
 from pathlib import Path
+from urllib.parse import urlsplit
 from typing import List, Dict, Any, Optional
 from loguru import logger
-import re
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - httpx needs it for http2=True
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
 from config import config
 
+# Image file extensions by URL path suffix, and the substrings checked when the path has none.
+_EXTENSIONS = {".webp": "webp", ".jpg": "jpg", ".jpeg": "jpg", ".png": "png", ".gif": "gif"}
+_EXTENSION_MARKERS = (("webp", "webp"), ("jpg", "jpg"), ("jpeg", "jpg"), ("png", "png"), ("gif", "gif"))
+
+# Profile keys written to their own files (or dropped) rather than into profile_data.json.
+_JSON_EXCLUDED_KEYS = {"html", "html_future", "screenshot_paths"}
+
+# Characters that are not allowed in profile folder names.
+_UNSAFE_NAME_CHARS = str.maketrans('', '', '\\/*?:"<>|')
+
+# Headers sent with every image download; mimic the mobile Safari page the URLs come from.
+_DOWNLOAD_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://tinder.com/',
+    'Sec-Fetch-Dest': 'image',
+    'Sec-Fetch-Mode': 'no-cors',
+    'Sec-Fetch-Site': 'cross-site',
+}
+
+# Client shared by all downloads so connections (and HTTP/2 streams) are reused; see get_client.
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared download client, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient with a keep-alive connection pool (HTTP/2 when h2 is installed)
+    """
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=30.0),
+            headers=_DOWNLOAD_HEADERS,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            follow_redirects=True
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared download client, if it was created."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+def write_json(path: str, data: Dict[str, Any]) -> None:
+    """
+    Write data as indented UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable dictionary
+    """
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _image_extension(url: str) -> str:
+    """Pick a file extension from the URL path suffix, falling back to a scan of the whole URL."""
+    ext = _EXTENSIONS.get(Path(urlsplit(url).path).suffix.lower())
+    if ext:
+        return ext
+    lowered = url.lower()
+    for marker, ext in _EXTENSION_MARKERS:
+        if marker in lowered:
+            return ext
+    return "jpg"
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with a little jitter so parallel retries don't line up."""
+    return 0.25 * (2 ** attempt) + random.uniform(0, 0.1)
+
+
+def _is_downloadable(url: str) -> bool:
+    """Signed images-ssl.gotinder.com URLs need the browser's auth and cannot be fetched directly."""
+    return not ('images-ssl.gotinder.com' in url and ('Policy=' in url or 'Signature=' in url))
+
+
+def _save_url_file(save_path: str, url: str, ensure_dir: bool = True) -> None:
+    """Record an image URL next to where the image would have been saved."""
+    if ensure_dir:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+    with open(f"{save_path}.url", 'w') as f:
+        f.write(url)
+
 
-async def download_image(url: str, save_path: str, timeout: int = 30, max_retries: int = 3) -> bool:
+async def download_image(url: str, save_path: str, timeout: int = 30, max_retries: int = 3,
+                         ensure_dir: bool = True) -> bool:
     """
     Download image from URL asynchronously and save to specified path.
     
@@ -28,6 +139,7 @@ async def download_image(url: str, save_path: str, timeout: int = 30, max_retrie
         save_path: Path to save the image to
         timeout: Timeout in seconds
         max_retries: Maximum number of retry attempts
+        ensure_dir: Create the parent directory first; callers that already made it pass False
         
     Returns:
         True if download succeeded, False otherwise
@@ -36,65 +148,63 @@ async def download_image(url: str, save_path: str, timeout: int = 30, max_retrie
     if not url.startswith('https://'):
         logger.error(f"Invalid URL format: {url}")
         return False
-    if 'images-ssl.gotinder.com' in url and ('Policy=' in url or 'Signature=' in url):
+    if not _is_downloadable(url):
         logger.warning(f"Tinder image URL requires authentication, can't download directly: {url}")
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        with open(f"{save_path}.url", 'w') as f:
-            f.write(url)
+        _save_url_file(save_path, url, ensure_dir)
         return False
     for attempt in range(max_retries):
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1',
-                'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://tinder.com/',
-                'Sec-Fetch-Dest': 'image',
-                'Sec-Fetch-Mode': 'no-cors',
-                'Sec-Fetch-Site': 'cross-site',
-            }
-            logger.info(f"Downloading image from {url} (attempt {attempt+1}/{max_retries})")
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    timeout=timeout,
-                    follow_redirects=True,
-                    headers=headers
-                )
+            logger.info("Downloading image from {} (attempt {}/{})", url, attempt + 1, max_retries)
+            client = await get_client()
+            async with client.stream("GET", url, timeout=httpx.Timeout(timeout, connect=5.0)) as response:
                 response.raise_for_status()
                 content_type = response.headers.get('content-type', '')
                 if not content_type.startswith('image/'):
                     logger.warning(f"URL didn't return an image: {url} (Content-Type: {content_type})")
-                    if len(response.content) < 1000:
-                        logger.warning(f"Small response received ({len(response.content)} bytes), retrying...")
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(1)
-                            continue
-                        else:
-                            return False
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                with open(save_path, 'wb') as f:
-                    f.write(response.content)
-                logger.info(f"Downloaded image to {save_path} ({len(response.content)} bytes)")
-                return True
+                    content_length = response.headers.get('content-length')
+                    body_size = int(content_length) if content_length else len(await response.aread())
+                    if body_size < 1000:
+                        logger.warning(f"Small response received ({body_size} bytes), giving up")
+                        return False
+                if ensure_dir:
+                    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+                # Stream into a .part file and only move it into place once complete, so a
+                # failed transfer never leaves a truncated image at save_path.
+                part_path = f"{save_path}.part"
+                size = 0
+                try:
+                    async with aiofiles.open(part_path, 'wb') as f:
+                        async for chunk in response.aiter_bytes(65536):
+                            await f.write(chunk)
+                            size += len(chunk)
+                except BaseException:
+                    try:
+                        os.remove(part_path)
+                    except OSError:
+                        pass
+                    raise
+                os.replace(part_path, save_path)
+            logger.info("Downloaded image to {} ({} bytes)", save_path, size)
+            return True
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error downloading image: {e.response.status_code} - {url}")
             if e.response.status_code == 403:
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                with open(f"{save_path}.url", 'w') as f:
-                    f.write(url)
+                _save_url_file(save_path, url, ensure_dir)
                 logger.warning(f"Access forbidden, URL requires authentication. Saved URL to {save_path}.url")
                 return False
-            if 500 <= e.response.status_code < 600 and attempt < max_retries - 1:
-                logger.warning("Server error, retrying in 1 second...")
-                await asyncio.sleep(1)
+            retryable = e.response.status_code in (408, 429) or 500 <= e.response.status_code < 600
+            if retryable and attempt < max_retries - 1:
+                delay = _retry_delay(attempt)
+                logger.warning(f"Server error, retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
                 continue
             return False
         except Exception as e:
             logger.error(f"Failed to download image from {url} to {save_path}: {str(e)}")
             if attempt < max_retries - 1:
-                logger.warning("Retrying in 1 second...")
-                await asyncio.sleep(1)
+                delay = _retry_delay(attempt)
+                logger.warning(f"Retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
             else:
                 return False
     return False
@@ -114,7 +224,7 @@ async def process_profile_data(profile_data: Dict[str, Any]) -> Dict[str, Any]:
         logger.error("Profile data is missing a name, cannot process")
         profile_data["name"] = "Unknown"
     name = profile_data["name"]
-    safe_name = re.sub(r'[\\/*?:"<>|]', "", name)
+    safe_name = name.translate(_UNSAFE_NAME_CHARS)
     timestamp = int(time.time())
     folder_name = f"{safe_name}_{timestamp}"
     profile_dir = os.path.join(config.OUTPUT_DIR, folder_name)
@@ -127,31 +237,25 @@ async def process_profile_data(profile_data: Dict[str, Any]) -> Dict[str, Any]:
         logger.error("CRITICAL ERROR: Profile Photo 1 not found in data. Stopping processing.")
         profile_data["error"] = "Missing Profile Photo 1"
         json_path = os.path.join(profile_dir, "profile_data.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(profile_data, f, indent=2, ensure_ascii=False)
+        error_data = {k: v for k, v in profile_data.items() if k not in _JSON_EXCLUDED_KEYS}
+        write_json(json_path, error_data)
         logger.error("Exiting immediately as Profile Photo 1 is required")
         sys.exit(1)
         return profile_data
     backup_urls = profile_data.get("image_urls_backup", [])
     if backup_urls:
-        for url in backup_urls:
-            if url not in image_urls:
-                image_urls.append(url)
+        image_urls[:] = dict.fromkeys(itertools.chain(image_urls, backup_urls))
         logger.info(f"Added {len(backup_urls)} backup image URLs, total is now {len(image_urls)}")
     labeled_backup_path = os.path.join(profile_dir, "labeled_image_urls.txt")
-    with open(labeled_backup_path, 'w', encoding='utf-8') as f:
-        for label, url in labeled_image_urls.items():
-            f.write(f"{label}: {url}\n")
-    with open(os.path.join(profile_dir, "image_urls_backup.txt"), 'w', encoding='utf-8') as f:
-        for url in image_urls:
-            f.write(f"{url}\n")
+    Path(labeled_backup_path).write_text(
+        "".join(f"{label}: {url}\n" for label, url in labeled_image_urls.items()), encoding='utf-8')
+    Path(profile_dir, "image_urls_backup.txt").write_text(
+        "".join(f"{url}\n" for url in image_urls), encoding='utf-8')
     image_local_paths = []
     successful_downloads = []
     downloaded_images_info = []
     logger.info(f"Processing {len(image_urls)} images including {len(labeled_image_urls)} labeled images")
-    download_tasks = []
     image_info = []
-    batch_size = 3
     for label, url in labeled_image_urls.items():
         safe_label = label.replace(" ", "_").lower()
         if not url or 'https://images-ssl.gotinder.com/' not in url:
@@ -161,16 +265,7 @@ async def process_profile_data(profile_data: Dict[str, Any]) -> Dict[str, Any]:
             logger.info(f"Processing Profile Photo 1 URL: {url[:100]}...")
             if "Signature=" not in url:
                 logger.warning("Profile Photo 1 URL doesn't contain a signature!")
-        if "webp" in url.lower():
-            ext = "webp"
-        elif "jpg" in url.lower() or "jpeg" in url.lower():
-            ext = "jpg"
-        elif "png" in url.lower():
-            ext = "png"
-        elif "gif" in url.lower():
-            ext = "gif"
-        else:
-            ext = "jpg"
+        ext = _image_extension(url)
         image_filename = f"{safe_label}.{ext}"
         image_path = os.path.join(profile_dir, image_filename)
         image_local_paths.append(image_path)
@@ -179,31 +274,12 @@ async def process_profile_data(profile_data: Dict[str, Any]) -> Dict[str, Any]:
             "path": image_path,
             "label": label
         })
-        download_tasks.append(download_image(url, image_path))
-        if len(download_tasks) >= batch_size or label == list(labeled_image_urls.keys())[-1]:
-            batch_results = await asyncio.gather(*download_tasks)
-            for j, result in enumerate(batch_results):
-                if result and j < len(image_info):
-                    successful_downloads.append(image_info[j]["path"])
-                    downloaded_images_info.append(image_info[j])
-                    logger.info(f"Successfully downloaded image: {image_info[j]['label']}")
-            download_tasks = []
-            image_info = []
-            await asyncio.sleep(0.5)
     unlabeled_count = 0
-    for i, url in enumerate(image_urls):
-        if url in labeled_image_urls.values():
+    labeled_values = set(labeled_image_urls.values())
+    for url in image_urls:
+        if url in labeled_values:
             continue
-        if "webp" in url.lower():
-            ext = "webp"
-        elif "jpg" in url.lower() or "jpeg" in url.lower():
-            ext = "jpg"
-        elif "png" in url.lower():
-            ext = "png"
-        elif "gif" in url.lower():
-            ext = "gif"
-        else:
-            ext = "jpg"
+        ext = _image_extension(url)
         unlabeled_count += 1
         image_filename = f"unlabeled_image_{unlabeled_count}.{ext}"
         image_path = os.path.join(profile_dir, image_filename)
@@ -213,17 +289,28 @@ async def process_profile_data(profile_data: Dict[str, Any]) -> Dict[str, Any]:
             "path": image_path,
             "label": f"Unlabeled Image {unlabeled_count}"
         })
-        download_tasks.append(download_image(url, image_path))
-        if len(download_tasks) >= batch_size or i == len(image_urls) - 1:
-            batch_results = await asyncio.gather(*download_tasks)
-            for j, result in enumerate(batch_results):
-                if result and j < len(image_info):
-                    successful_downloads.append(image_info[j]["path"])
-                    downloaded_images_info.append(image_info[j])
-                    logger.info(f"Successfully downloaded image: {image_info[j]['label']}")
-            download_tasks = []
-            image_info = []
-            await asyncio.sleep(0.5)
+    # At most three downloads in flight; the next one starts as soon as a slot frees up.
+    download_sem = asyncio.Semaphore(3)
+
+    async def limited_download(info: Dict[str, str]) -> bool:
+        async with download_sem:
+            return await download_image(info["url"], info["path"], ensure_dir=False)
+
+    # Signed URLs would fail on every attempt, so only their .url file is written.
+    downloadable_info = []
+    for info in image_info:
+        if _is_downloadable(info["url"]):
+            downloadable_info.append(info)
+        else:
+            logger.warning(f"Tinder image URL requires authentication, saving URL for {info['label']}")
+            _save_url_file(info["path"], info["url"], ensure_dir=False)
+    image_info = downloadable_info
+    results = await asyncio.gather(*(limited_download(info) for info in image_info))
+    for info, result in zip(image_info, results):
+        if result:
+            successful_downloads.append(info["path"])
+            downloaded_images_info.append(info)
+            logger.info("Successfully downloaded image: {}", info["label"])
     processed_data["image_local_paths"] = image_local_paths
     processed_data["successful_image_paths"] = successful_downloads
     processed_data["download_success_count"] = len(successful_downloads)
@@ -231,36 +318,39 @@ async def process_profile_data(profile_data: Dict[str, Any]) -> Dict[str, Any]:
     if labeled_image_urls:
         processed_data["labeled_image_urls"] = labeled_image_urls
     json_path = os.path.join(profile_dir, "profile_data.json")
-    json_data = processed_data.copy()
-    if "html" in json_data:
-        html_path = os.path.join(profile_dir, "profile.html")
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(json_data["html"])
-        json_data.pop("html")
-    if "screenshot_paths" in json_data:
-        json_data.pop("screenshot_paths")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, indent=2, ensure_ascii=False)
+    # The output files are independent, so they are written from worker threads in parallel.
+    writes = []
+    if "html_future" in processed_data:
+        try:
+            html_gz = await processed_data["html_future"]
+            writes.append(asyncio.to_thread(Path(profile_dir, "profile.html.gz").write_bytes, html_gz))
+        except Exception as e:
+            logger.error(f"Failed to capture profile HTML: {str(e)}")
+    json_data = {k: v for k, v in processed_data.items() if k not in _JSON_EXCLUDED_KEYS}
+    writes.append(asyncio.to_thread(write_json, json_path, json_data))
     summary_path = os.path.join(profile_dir, "summary.txt")
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        f.write(f"Name: {profile_data.get('name', 'Unknown')}\n")
-        f.write(f"Age: {profile_data.get('age', 'Unknown')}\n")
-        f.write(f"Images: {processed_data['download_success_count']} of {len(image_urls)} downloaded\n")
-        f.write("\nLabeled Images:\n")
-        for label, url in labeled_image_urls.items():
-            f.write(f"  {label}\n")
-        f.write(f"\nInterests: {', '.join(profile_data.get('interests', []))}\n\n")
-        f.write("Profile Sections:\n")
-        for section_name, section_data in profile_data.get("profile_sections", {}).items():
-            f.write(f"\n{section_name}:\n")
-            if isinstance(section_data, dict):
-                for key, value in section_data.items():
-                    f.write(f"  {key}: {value}\n")
-            elif isinstance(section_data, list):
-                for item in section_data:
-                    f.write(f"  - {item}\n")
-            else:
-                f.write(f"  {section_data}\n")
+    parts = [
+        f"Name: {profile_data.get('name', 'Unknown')}\n",
+        f"Age: {profile_data.get('age', 'Unknown')}\n",
+        f"Images: {processed_data['download_success_count']} of {len(image_urls)} downloaded\n",
+        "\nLabeled Images:\n",
+    ]
+    for label in labeled_image_urls:
+        parts.append(f"  {label}\n")
+    parts.append(f"\nInterests: {', '.join(profile_data.get('interests', []))}\n\n")
+    parts.append("Profile Sections:\n")
+    for section_name, section_data in profile_data.get("profile_sections", {}).items():
+        parts.append(f"\n{section_name}:\n")
+        if isinstance(section_data, dict):
+            for key, value in section_data.items():
+                parts.append(f"  {key}: {value}\n")
+        elif isinstance(section_data, list):
+            for item in section_data:
+                parts.append(f"  - {item}\n")
+        else:
+            parts.append(f"  {section_data}\n")
+    writes.append(asyncio.to_thread(Path(summary_path).write_text, "".join(parts), encoding='utf-8'))
+    await asyncio.gather(*writes)
     logger.info(f"Saved profile data to {json_path}")
     logger.info(f"Created summary at {summary_path}")
     logger.info(f"Downloaded {processed_data['download_success_count']} of {len(image_urls)} images")
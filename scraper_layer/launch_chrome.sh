@@ -9,7 +9,7 @@ if [ "$1" != "" ]; then
     PROFILE="$1"
 fi
 
-DEBUGGING_PORT=9222
+DEBUGGING_PORT="${REMOTE_DEBUGGING_PORT:-9222}"
 
 echo "Launching Chrome with remote debugging enabled"
 echo "Profile: $PROFILE"
@@ -15,7 +15,7 @@ import os
 import time
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 import argparse
 
@@ -25,9 +25,10 @@ from playwright.async_api import async_playwright
 from config import config
 from browser import (
     initialize_browser, navigate_to_tinder, interact_with_profile,
-    extract_profile_data, close_browser, extract_images
+    extract_profile_data, close_browser, extract_images,
+    get_or_create_browser, scrape_many, discard_html_future
 )
-from data_processor import process_profile_data
+from data_processor import process_profile_data, close_client
 
 
 def setup_logger():
@@ -88,12 +89,14 @@ async def run_tinder_scraper(profile_count: int = 1, capture_delay: float = 0.5)
                     profile_data = await extract_profile_data(page)
                     if not profile_data.get("name"):
                         logger.error("Could not extract profile name. Stopping.")
+                        await discard_html_future(profile_data)
                         return
                     if not any(key == "Profile Photo 1" for key in profile_data.get("labeled_image_urls", {}).keys()):
                         logger.error("CRITICAL ERROR: Profile Photo 1 not found in labeled URLs - aborting processing")
                         screenshot_path = os.path.join(config.OUTPUT_DIR, "missing_profile_photo_1.png")
                         await page.screenshot(path=screenshot_path)
                         logger.error(f"Screenshot saved to {screenshot_path}")
+                        await discard_html_future(profile_data)
                         return
                     processed_data = await process_profile_data(profile_data)
                     logger.info("Processed data summary:")
@@ -124,12 +127,65 @@ async def run_tinder_scraper(profile_count: int = 1, capture_delay: float = 0.5)
                     break
             finally:
                 await close_browser(browser, context, page)
+                await close_client()
         logger.info(f"Scraper execution completed in {(datetime.now() - start_time).total_seconds():.2f} seconds")
         logger.info(f"Successfully scraped {profile_counter} profiles")
     except Exception as e:
         logger.exception(f"Unexpected error in scraper: {str(e)}")
 
 
+async def run_parallel_scraper(profile_urls: List[str], n_workers: int = 4) -> None:
+    """
+    Scrape several profile URLs concurrently, each in its own page of a shared browser context.
+
+    Args:
+        profile_urls: URLs of the profiles to scrape
+        n_workers: Maximum number of profiles scraped at the same time
+    """
+    logger.info("Starting Tinder Profile Scraper in parallel mode")
+    logger.info(f"Output directory: {config.OUTPUT_DIR}")
+    logger.info(f"Profiles to scrape: {len(profile_urls)} with {n_workers} workers")
+    start_time = datetime.now()
+    try:
+        async with async_playwright() as playwright:
+            browser = await get_or_create_browser(playwright)
+            profile_queue: asyncio.Queue = asyncio.Queue()
+            processing = []
+
+            async def consume() -> None:
+                # Start saving each profile as soon as it is scraped instead of after the whole batch.
+                while True:
+                    item = await profile_queue.get()
+                    if item is None:
+                        return
+                    url, profile_data = item
+                    if not profile_data.get("name"):
+                        logger.error(f"Could not extract profile name from {url}. Skipping.")
+                        await discard_html_future(profile_data)
+                    elif not profile_data.get("labeled_image_urls", {}).get("Profile Photo 1"):
+                        logger.error(f"Profile Photo 1 not found for {url}. Skipping.")
+                        await discard_html_future(profile_data)
+                    else:
+                        processing.append(asyncio.create_task(process_profile_data(profile_data)))
+
+            consumer = asyncio.create_task(consume())
+            try:
+                await scrape_many(playwright, browser, profile_urls, n_workers, profile_queue)
+            finally:
+                await profile_queue.put(None)
+                await consumer
+            try:
+                processed = await asyncio.gather(*processing)
+            finally:
+                await close_client()
+            for processed_data in processed:
+                logger.info(f"Saved {processed_data['name']} to {processed_data.get('folder_path', 'Unknown')}")
+        logger.info(f"Scraper execution completed in {(datetime.now() - start_time).total_seconds():.2f} seconds")
+        logger.info(f"Successfully scraped {len(processed)} of {len(profile_urls)} profiles")
+    except Exception as e:
+        logger.exception(f"Unexpected error in scraper: {str(e)}")
+
+
 def parse_args():
     """Parse command line arguments."""
     import argparse
@@ -149,6 +205,17 @@ def parse_args():
         type=str,
         help="Path to Chrome executable"
     )
+    parser.add_argument(
+        "--profile-url",
+        action="append",
+        help="Profile URL to scrape; repeat to scrape several profiles concurrently"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of pages used when scraping several profile URLs"
+    )
     return parser.parse_args()
 
 
@@ -162,6 +229,9 @@ def main():
     if args.chrome_path:
         config.CHROME_EXECUTABLE_PATH = args.chrome_path
     setup_logger()
+    if args.profile_url:
+        asyncio.run(run_parallel_scraper(args.profile_url, n_workers=args.workers))
+        return
     asyncio.run(run_tinder_scraper(
         profile_count=1,
         capture_delay=0
@@ -184,7 +254,7 @@ def run_interactive():
         import socket
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            result = sock.connect_ex(('localhost', config.REMOTE_DEBUGGING_PORT))
+            result = sock.connect_ex(('127.0.0.1', config.REMOTE_DEBUGGING_PORT))
             sock.close()
             if result == 0:
                 print(f"Found Chrome running with remote debugging on port {config.REMOTE_DEBUGGING_PORT}")
@@ -0,0 +1,177 @@
+"""
+Tests for the profile parsing and scraping helpers in the browser module.
+"""
+
+import asyncio
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+
+import browser
+from browser import _parse_name_and_age, _merge_interests, extract_profile_data
+
+
+def test_parse_name_and_age_from_header():
+    """Test parsing the primary "Name 25" header text."""
+    assert _parse_name_and_age("Alex 25", []) == ("Alex", 25)
+
+
+def test_parse_name_and_age_header_without_age():
+    """Test that a header without digits keeps the name and leaves the age empty."""
+    assert _parse_name_and_age("  Alex  ", []) == ("Alex", None)
+
+
+def test_parse_name_and_age_from_alternatives():
+    """Test falling back to the first alternative text that contains a name and age."""
+    alternatives = [[], ["Passions"], ["Sam, 31", "Other 40"]]
+    assert _parse_name_and_age(None, alternatives) == ("Sam", 31)
+
+
+def test_parse_name_and_age_not_found():
+    """Test that nothing usable yields (None, None)."""
+    assert _parse_name_and_age(None, [["Passions"], []]) == (None, None)
+
+
+def test_merge_interests_prefers_primary():
+    """Test that primary interests win over the alternatives."""
+    assert _merge_interests(["Hiking"], [["Cooking"]]) == ["Hiking"]
+
+
+def test_merge_interests_deduplicates_alternatives_in_order():
+    """Test that alternative texts are merged in order without duplicates."""
+    alternatives = [["Hiking", "Coffee"], ["Coffee", "Travel"], []]
+    assert _merge_interests([], alternatives) == ["Hiking", "Coffee", "Travel"]
+
+
+class FailingPage:
+    """Page whose every evaluate fails, as after a navigation destroys the context."""
+
+    def __init__(self):
+        self.profile_data = {}
+
+    async def evaluate(self, *args, **kwargs):
+        raise PlaywrightError("Execution context was destroyed")
+
+
+@pytest.mark.asyncio
+async def test_extract_profile_data_survives_failed_snapshot(monkeypatch):
+    """Test that a failing snapshot keeps the extracted images instead of dropping the profile."""
+    async def fake_extract_images(page):
+        page.profile_data["labeled_image_urls"] = {"Profile Photo 1": "https://example.com/1.jpg"}
+        return ["https://example.com/1.jpg"]
+
+    monkeypatch.setattr(browser, "extract_images", fake_extract_images)
+    monkeypatch.setattr(browser.config, "SAVE_HTML", False)
+
+    profile_data = await extract_profile_data(FailingPage())
+
+    assert profile_data["name"] is None
+    assert profile_data["image_urls"] == ["https://example.com/1.jpg"]
+    assert profile_data["labeled_image_urls"] == {"Profile Photo 1": "https://example.com/1.jpg"}
+    assert profile_data["profile_sections"] == {}
+
+
+IPHONE = {
+    "user_agent": "Mozilla/5.0 (iPhone)",
+    "viewport": {"width": 428, "height": 746},
+    "device_scale_factor": 3,
+    "is_mobile": True,
+    "has_touch": True,
+}
+
+
+class FakeSession:
+    """CDP session that records the commands sent through it."""
+
+    def __init__(self):
+        self.commands = {}
+
+    async def send(self, method, params=None):
+        self.commands[method] = params
+
+    async def detach(self):
+        pass
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.session = FakeSession()
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def new_cdp_session(self, page):
+        return page.session
+
+
+class FakeBrowser:
+    def __init__(self, context):
+        self.contexts = [context]
+
+
+class FakePlaywright:
+    devices = {"iPhone 12 Pro Max": IPHONE}
+
+
+@pytest.mark.asyncio
+async def test_scrape_many_emulates_remote_worker_pages(monkeypatch):
+    """Test that every worker page opened in the remote Chrome context gets the iPhone emulation."""
+    async def fake_scrape_profile(page, profile_url):
+        return {"name": profile_url}
+
+    monkeypatch.setattr(browser, "scrape_profile", fake_scrape_profile)
+    monkeypatch.setattr(browser.config, "USE_REMOTE_CHROME", True)
+    monkeypatch.setattr(browser, "_IPHONE_DESCRIPTOR", None)
+    context = FakeContext()
+
+    results = await browser.scrape_many(FakePlaywright(), FakeBrowser(context), ["a", "b", "c"], n_workers=3)
+
+    assert [result["name"] for result in results] == ["a", "b", "c"]
+    assert len(context.pages) == 3
+    for page in context.pages:
+        commands = page.session.commands
+        assert commands["Emulation.setDeviceMetricsOverride"] == {
+            "width": 428, "height": 746, "deviceScaleFactor": 3, "mobile": True
+        }
+        assert commands["Emulation.setTouchEmulationEnabled"] == {"enabled": True}
+        assert commands["Network.setUserAgentOverride"] == {"userAgent": "Mozilla/5.0 (iPhone)"}
+        assert "Network.setBlockedURLs" in commands
+
+
+@pytest.mark.asyncio
+async def test_discard_html_future_retrieves_failure():
+    """Test that a failed HTML capture is consumed and removed from the profile."""
+    async def failing_capture():
+        raise PlaywrightError("Target closed")
+
+    html_future = asyncio.create_task(failing_capture())
+    await asyncio.sleep(0)
+    profile_data = {"name": "Alex", "html_future": html_future}
+
+    await browser.discard_html_future(profile_data)
+
+    assert profile_data == {"name": "Alex"}
+    assert html_future.done()
+
+
+@pytest.mark.asyncio
+async def test_discard_html_future_cancels_pending_capture():
+    """Test that a capture still in flight is cancelled."""
+    html_future = asyncio.create_task(asyncio.sleep(10))
+    profile_data = {"html_future": html_future}
+
+    await browser.discard_html_future(profile_data)
+
+    assert profile_data == {}
+    assert html_future.cancelled()
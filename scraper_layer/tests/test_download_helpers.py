@@ -0,0 +1,233 @@
+"""
+Tests for the image download helpers and profile saving in the data processor module.
+"""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+import httpx
+
+import data_processor
+from data_processor import (
+    _image_extension,
+    _is_downloadable,
+    _retry_delay,
+    download_image,
+    process_profile_data
+)
+
+
+SIGNED_URL = "https://images-ssl.gotinder.com/u/abc/photo.jpg?Policy=p&Signature=s&Key-Pair-Id=k"
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://example.com/a/photo.webp", "webp"),
+    ("https://example.com/a/photo.JPEG?Sig=1", "jpg"),
+    ("https://example.com/a/photo.jpg", "jpg"),
+    ("https://example.com/a/photo.png", "png"),
+    ("https://example.com/a/photo.gif", "gif"),
+    ("https://example.com/a/photo?format=png", "png"),
+    ("https://example.com/a/photo.bin?type=webp", "webp"),
+    ("https://example.com/a/photo", "jpg"),
+])
+def test_image_extension(url, expected):
+    """Test extension detection from the path suffix with the substring fallback."""
+    assert _image_extension(url) == expected
+
+
+def test_is_downloadable():
+    """Test that only signed images-ssl.gotinder.com URLs are treated as requiring auth."""
+    assert not _is_downloadable(SIGNED_URL)
+    assert not _is_downloadable("https://images-ssl.gotinder.com/u/abc/photo.jpg?Policy=p")
+    assert _is_downloadable("https://images-ssl.gotinder.com/u/abc/photo.jpg")
+    assert _is_downloadable("https://example.com/photo.jpg?Signature=s")
+
+
+def test_retry_delay_grows_exponentially_with_bounded_jitter():
+    """Test the retry backoff schedule."""
+    for attempt, base in [(0, 0.25), (1, 0.5), (2, 1.0)]:
+        for _ in range(20):
+            delay = _retry_delay(attempt)
+            assert base <= delay <= base + 0.1
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Route the shared download client through a scripted MockTransport."""
+    responses = []
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return responses.pop(0)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(data_processor, "_CLIENT", client)
+    monkeypatch.setattr(data_processor, "_retry_delay", lambda attempt: 0)
+    yield responses, requests
+
+
+def image_response(content=b"\xff\xd8" + b"x" * 2000):
+    return httpx.Response(200, headers={"content-type": "image/jpeg"}, content=content)
+
+
+@pytest.mark.asyncio
+async def test_download_image_success(mock_client, tmp_path):
+    """Test that a successful download lands at save_path with no .part file left."""
+    responses, requests = mock_client
+    content = b"\xff\xd8" + b"x" * 2000
+    responses.append(image_response(content))
+    save_path = tmp_path / "photo.jpg"
+
+    assert await download_image("https://example.com/photo.jpg", str(save_path))
+
+    assert save_path.read_bytes() == content
+    assert not (tmp_path / "photo.jpg.part").exists()
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [408, 429, 500, 503])
+async def test_download_image_retries_transient_errors(mock_client, tmp_path, status):
+    """Test that 408, 429 and 5xx responses are retried."""
+    responses, requests = mock_client
+    responses.extend([httpx.Response(status), image_response()])
+
+    assert await download_image("https://example.com/photo.jpg", str(tmp_path / "photo.jpg"))
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [400, 404, 410])
+async def test_download_image_does_not_retry_permanent_errors(mock_client, tmp_path, status):
+    """Test that other 4xx responses fail on the first attempt."""
+    responses, requests = mock_client
+    responses.append(httpx.Response(status))
+
+    assert not await download_image("https://example.com/photo.jpg", str(tmp_path / "photo.jpg"))
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_download_image_forbidden_saves_url(mock_client, tmp_path):
+    """Test that a 403 records the URL in a .url sidecar without retrying."""
+    responses, requests = mock_client
+    responses.append(httpx.Response(403))
+    save_path = tmp_path / "photo.jpg"
+
+    assert not await download_image("https://example.com/photo.jpg", str(save_path))
+    assert (tmp_path / "photo.jpg.url").read_text() == "https://example.com/photo.jpg"
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_download_image_small_non_image_is_permanent(mock_client, tmp_path):
+    """Test that a tiny non-image body is not retried."""
+    responses, requests = mock_client
+    responses.append(httpx.Response(200, headers={"content-type": "text/html"}, content=b"<html></html>"))
+
+    assert not await download_image("https://example.com/photo.jpg", str(tmp_path / "photo.jpg"))
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_download_image_skips_signed_urls(mock_client, tmp_path):
+    """Test that signed Tinder URLs are never requested."""
+    responses, requests = mock_client
+    save_path = tmp_path / "photo.jpg"
+
+    assert not await download_image(SIGNED_URL, str(save_path))
+    assert (tmp_path / "photo.jpg.url").read_text() == SIGNED_URL
+    assert not requests
+
+
+class BrokenStream(httpx.AsyncByteStream):
+    """Response body that fails after the first chunk."""
+
+    async def __aiter__(self):
+        yield b"\xff\xd8" + b"x" * 100
+        raise httpx.ReadError("connection reset")
+
+
+@pytest.mark.asyncio
+async def test_download_image_failed_stream_leaves_no_file(mock_client, tmp_path):
+    """Test that a transfer failing mid-stream on every attempt leaves nothing at save_path."""
+    responses, requests = mock_client
+    for _ in range(3):
+        responses.append(httpx.Response(200, headers={"content-type": "image/jpeg"}, stream=BrokenStream()))
+    save_path = tmp_path / "photo.jpg"
+
+    assert not await download_image("https://example.com/photo.jpg", str(save_path))
+    assert not save_path.exists()
+    assert not (tmp_path / "photo.jpg.part").exists()
+    assert len(requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_process_profile_data_writes_profile_folder(mock_client, tmp_path, monkeypatch):
+    """Test the files written for a profile, the download order and the gzipped HTML."""
+    responses, requests = mock_client
+    monkeypatch.setattr(data_processor.config, "OUTPUT_DIR", str(tmp_path))
+    for _ in range(3):
+        responses.append(image_response())
+    photo_1 = "https://images-ssl.gotinder.com/u/abc/one.webp"
+    photo_3 = "https://images-ssl.gotinder.com/u/abc/three.jpg"
+    unlabeled = "https://images-ssl.gotinder.com/u/abc/four.png"
+    html_gz = gzip.compress(b"<html>profile</html>")
+
+    async def capture_html():
+        return html_gz
+
+    profile_data = {
+        "name": "Alex/Smith",
+        "age": 25,
+        "image_urls": [photo_1, SIGNED_URL, photo_3],
+        "image_urls_backup": [photo_3, unlabeled],
+        "labeled_image_urls": {
+            "Profile Photo 1": photo_1,
+            "Profile Photo 2": SIGNED_URL,
+            "Profile Photo 3": photo_3,
+        },
+        "interests": ["Hiking"],
+        "profile_sections": {"About me": "Hello"},
+        "html_future": asyncio.create_task(capture_html()),
+    }
+
+    processed = await process_profile_data(profile_data)
+
+    folder = next(tmp_path.iterdir())
+    assert processed["folder_path"] == str(folder)
+    assert folder.name.startswith("AlexSmith_")
+    assert processed["image_local_paths"] == [
+        str(folder / "profile_photo_1.webp"),
+        str(folder / "profile_photo_2.jpg"),
+        str(folder / "profile_photo_3.jpg"),
+        str(folder / "unlabeled_image_1.png"),
+    ]
+    assert processed["successful_image_paths"] == [
+        str(folder / "profile_photo_1.webp"),
+        str(folder / "profile_photo_3.jpg"),
+        str(folder / "unlabeled_image_1.png"),
+    ]
+    assert [info["label"] for info in processed["downloaded_images"]] == [
+        "Profile Photo 1", "Profile Photo 3", "Unlabeled Image 1"
+    ]
+    assert processed["download_success_count"] == 3
+    assert sorted(str(request.url) for request in requests) == sorted([photo_1, photo_3, unlabeled])
+
+    assert (folder / "profile_photo_2.jpg.url").read_text() == SIGNED_URL
+    assert (folder / "labeled_image_urls.txt").read_text() == (
+        f"Profile Photo 1: {photo_1}\nProfile Photo 2: {SIGNED_URL}\nProfile Photo 3: {photo_3}\n"
+    )
+    assert (folder / "image_urls_backup.txt").read_text() == f"{photo_1}\n{SIGNED_URL}\n{photo_3}\n{unlabeled}\n"
+    assert (folder / "profile.html.gz").read_bytes() == html_gz
+    summary = (folder / "summary.txt").read_text()
+    assert "Name: Alex/Smith" in summary
+    assert "Images: 3 of 4 downloaded" in summary
+
+    saved = json.loads((folder / "profile_data.json").read_text())
+    assert "html_future" not in saved
+    assert saved["name"] == "Alex/Smith"
+    assert saved["successful_image_paths"] == processed["successful_image_paths"]